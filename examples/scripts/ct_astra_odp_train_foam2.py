@@ -44,7 +44,11 @@ a learned stage-wise parameter weighting the contribution of the fidelity
 term. The output of the final stage is the set of reconstructed images.
 """
 
+# isort: off
 import os
+
+os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
+
 from functools import partial
 from time import time
 
@@ -61,10 +65,10 @@ from scico.flax.train.traversals import clip_positive, construct_traversal
 from scico.linop.xray.astra import XRayTransform2D
 
 """
-Prepare parallel processing. Set an arbitrary processor count (only
-applies if GPU is not available).
+Prepare parallel processing. An arbitrary processor count (only
+applies if GPU is not available) is set at the start of the script
+since it has no effect once jax has been initialized.
 """
-os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
 platform = jax.lib.xla_bridge.get_backend().platform
 print("Platform: ", platform)
 
@@ -194,7 +198,7 @@ Evaluate on testing data.
 del train_ds["image"]
 del train_ds["label"]
 
-fmap = sflax.FlaxMap(model, modvar)
+fmap = sflax.FlaxMap(model, modvar, pmap=True)
 del model, modvar
 
 maxn = numtt
@@ -13,7 +13,11 @@ previously filtered back projections (FBP) for CT reconstruction inspired
 by :cite:`jin-2017-unet`.
 """
 
+# isort: off
 import os
+
+os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
+
 from time import time
 
 import jax
@@ -25,10 +29,10 @@ from scico import metric, plot
 from scico.flax.examples import load_ct_data
 
 """
-Prepare parallel processing. Set an arbitrary processor count (only
-applies if GPU is not available).
+Prepare parallel processing. An arbitrary processor count (only
+applies if GPU is not available) is set at the start of the script
+since it has no effect once jax has been initialized.
 """
-os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
 platform = jax.lib.xla_bridge.get_backend().platform
 print("Platform: ", platform)
 
@@ -122,7 +126,7 @@ Evaluate on testing data.
 del train_ds["image"]
 del train_ds["label"]
 
-fmap = sflax.FlaxMap(model, modvar)
+fmap = sflax.FlaxMap(model, modvar, pmap=True)
 del model, modvar
 
 maxn = test_nimg // 2
@@ -41,7 +41,11 @@ identity operator. The output of the final stage is the set of deblurred
 images.
 """
 
+# isort: off
 import os
+
+os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
+
 from functools import partial
 from time import time
 
@@ -58,10 +62,10 @@ from scico.flax.train.traversals import clip_positive, construct_traversal
 from scico.linop import CircularConvolve
 
 """
-Prepare parallel processing. Set an arbitrary processor count (only
-applies if GPU is not available).
+Prepare parallel processing. An arbitrary processor count (only
+applies if GPU is not available) is set at the start of the script
+since it has no effect once jax has been initialized.
 """
-os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
 platform = jax.lib.xla_bridge.get_backend().platform
 print("Platform: ", platform)
 
@@ -77,7 +81,6 @@ psf = np.ones((n, n)) / (n * n)  # blur kernel
 
 ishape = (output_size, output_size)
 opBlur = CircularConvolve(h=psf, input_shape=ishape)
-opBlur_vmap = jax.vmap(opBlur)  # for batch processing in data generation
 
 
 """
@@ -164,11 +167,13 @@ workdir2 = os.path.join(
 stats_object_ini = None
 stats_object = None
 
-checkpoint_files = []
-for dirpath, dirnames, filenames in os.walk(workdir2):
-    checkpoint_files = [fn for fn in filenames]
+# Checkpoints are stored in subdirectories named by training step.
+checkpoint_exists = False
+if os.path.isdir(workdir2):
+    with os.scandir(workdir2) as entries:
+        checkpoint_exists = any(e.is_dir() and e.name.isdigit() for e in entries)
 
-if len(checkpoint_files) > 0:
+if checkpoint_exists:
     model = sflax.MoDLNet(
         operator=opBlur,
         depth=model_conf["depth"],
@@ -247,7 +252,7 @@ Evaluate on testing data.
 del train_ds["image"]
 del train_ds["label"]
 
-fmap = sflax.FlaxMap(model, modvar)
+fmap = sflax.FlaxMap(model, modvar, pmap=True)
 del model, modvar
 
 maxn = test_nimg // 4
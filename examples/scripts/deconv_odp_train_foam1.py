@@ -49,7 +49,11 @@ $\mathcal{K}$ is the DFT of $K$. The output of the final stage is the
 set of deblurred images.
 """
 
+# isort: off
 import os
+
+os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
+
 from functools import partial
 from time import time
 
@@ -66,10 +70,10 @@ from scico.flax.train.traversals import clip_positive, construct_traversal
 from scico.linop import CircularConvolve
 
 """
-Prepare parallel processing. Set an arbitrary processor count (only
-applies if GPU is not available).
+Prepare parallel processing. An arbitrary processor count (only
+applies if GPU is not available) is set at the start of the script
+since it has no effect once jax has been initialized.
 """
-os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
 platform = jax.lib.xla_bridge.get_backend().platform
 print("Platform: ", platform)
 
@@ -85,7 +89,6 @@ psf = np.ones((n, n)) / (n * n)  # blur kernel
 
 ishape = (output_size, output_size)
 opBlur = CircularConvolve(h=psf, input_shape=ishape)
-opBlur_vmap = jax.vmap(opBlur)  # for batch processing in data generation
 
 
 """
@@ -188,7 +191,7 @@ Evaluate on testing data.
 del train_ds["image"]
 del train_ds["label"]
 
-fmap = sflax.FlaxMap(model, modvar)
+fmap = sflax.FlaxMap(model, modvar, pmap=True)
 del model, modvar
 
 maxn = test_nimg // 4
@@ -33,6 +33,10 @@ os.environ["JAX_PLATFORM_NAME"] = "cpu"
 os.environ["JAX_PLATFORMS"] = "cpu"
 
 
+import numpy as np
+
+import jax
+
 from xdesign import SiemensStar, discrete_phantom
 
 import scico.numpy as snp
@@ -75,10 +79,14 @@ def eval_params(config, x_gt, psf, y):
     dict of specific parameters for evaluation of a single parameter
     set (a pair of parameters in this case). The remaining parameters
     are objects that are passed to the evaluation function via the
-    ray object store.
+    ray object store. These are NumPy arrays, which can be read from
+    the object store without deserialization, and which are copied to
+    the device once for each evaluation.
     """
     # Extract solver parameters from config dict.
     λ, ρ = config["lambda"], config["rho"]
+    # Copy problem arrays to the device.
+    x_gt, psf, y = jax.device_put((x_gt, psf, y))
     # Set up problem to be solved.
     A = linop.Convolve(h=psf, input_shape=x_gt.shape)
     f = loss.SquaredL2Loss(y=y, A=A)
@@ -111,7 +119,7 @@ resources = {"cpu": 4, "gpu": 0}  # cpus per trial, gpus per trial
 Run parameter search.
 """
 tuner = tune.Tuner(
-    tune.with_parameters(eval_params, x_gt=x_gt, psf=psf, y=y),
+    tune.with_parameters(eval_params, x_gt=np.asarray(x_gt), psf=np.asarray(psf), y=np.asarray(y)),
     param_space=config,
     resources=resources,
     metric="psnr",
@@ -13,7 +13,11 @@ from :cite:`zhang-2017-dncnn` to denoise images that have been corrupted
 with additive Gaussian noise.
 """
 
+# isort: off
 import os
+
+os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
+
 from time import time
 
 import numpy as np
@@ -27,10 +31,10 @@ from scico import metric, plot
 from scico.flax.examples import load_image_data
 
 """
-Prepare parallel processing. Set an arbitrary processor count (only
-applies if GPU is not available).
+Prepare parallel processing. An arbitrary processor count (only
+applies if GPU is not available) is set at the start of the script
+since it has no effect once jax has been initialized.
 """
-os.environ["XLA_FLAGS"] = "--xla_force_host_platform_device_count=8"
 platform = jax.lib.xla_bridge.get_backend().platform
 print("Platform: ", platform)
 
@@ -120,7 +124,7 @@ Evaluate on testing data.
 """
 test_patches = 720
 start_time = time()
-fmap = sflax.FlaxMap(model, modvar)
+fmap = sflax.FlaxMap(model, modvar, pmap=True)
 output = fmap(test_ds["image"][:test_patches])
 time_eval = time() - start_time
 output = np.clip(output, a_min=0, a_max=1.0)
@@ -154,6 +154,13 @@ class IterationStats:
     def insert(self, values: Union[List, Tuple]):
         """Insert a list of values for a single iteration.
 
+        Values are recorded as provided, without conversion. In
+        particular, jax arrays are only transferred to the host when
+        they are displayed, so that recording statistics does not block
+        asynchronous dispatch of subsequent solver iterations when
+        display is disabled, or for iterations that are not displayed
+        when `overwrite` is ``False`` and `period` is greater than one.
+
         Args:
             values: Statistics for a single iteration.
         """
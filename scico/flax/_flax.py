@@ -12,7 +12,10 @@ from typing import Any, Optional
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
-from flax import serialization
+import jax
+import jax.numpy as jnp
+
+from flax import jax_utils, serialization
 from flax.linen.module import Module
 from scico.numpy import Array, BlockArray
 from scico.typing import Shape
@@ -57,15 +60,28 @@ def save_variables(variables: PyTree, filename: str):
 class FlaxMap:
     r"""A trained flax model."""
 
-    def __init__(self, model: Module, variables: PyTree):
+    def __init__(self, model: Module, variables: PyTree, pmap: bool = False):
         r"""Initialize a :class:`FlaxMap` object.
 
         Args:
             model: Flax model to apply.
             variables: Parameters and batch stats of trained model.
+            pmap: If ``True`` and more than one local device is
+                available, batched input is split across the devices
+                and evaluated in parallel. The batch is padded to a
+                multiple of the number of devices, so this is intended
+                for evaluation of large batches, e.g. a testing set.
+                Default: ``False``.
         """
         self.model = model
         self.variables = variables
+        self.pmap = pmap
+        if pmap:
+            # Replicate variables on the local devices once, not on each call
+            self._p_variables = jax_utils.replicate(variables)
+            self._p_apply = jax.pmap(
+                lambda variables, x: self.model.apply(variables, x, train=False, mutable=False)
+            )
         super().__init__()
 
     def __call__(self, x: Array) -> Array:
@@ -93,7 +109,16 @@ class FlaxMap:
         elif xndim == 3:
             x = x.reshape((1,) + x.shape)
             axsqueeze = (0,)
-        y = self.model.apply(self.variables, x, train=False, mutable=False)
+        ndev = jax.local_device_count()
+        if self.pmap and ndev > 1 and x.shape[0] > 1 and not isinstance(x, jax.core.Tracer):
+            # Pad batch to a multiple of the number of devices and shard
+            K = x.shape[0]
+            Kpad = -(-K // ndev) * ndev
+            x = jnp.pad(x, ((0, Kpad - K),) + ((0, 0),) * (x.ndim - 1))
+            y = self._p_apply(self._p_variables, x.reshape((ndev, -1) + x.shape[1:]))
+            y = y.reshape((Kpad,) + y.shape[2:])[:K]
+        else:
+            y = self.model.apply(self.variables, x, train=False, mutable=False)
         if y.ndim != xndim:
             return y.squeeze(axis=axsqueeze)
         return y
@@ -296,10 +296,11 @@ def generate_blur_data(
     ishape = (size, size)
     A = CircularConvolve(h=blur_kernel, input_shape=ishape)
 
-    # Compute blurred images in parallel
+    # Compute blurred images in parallel, with a single batched
+    # convolution of all the images in the shard on each device
     a_map = lambda v: jnp.atleast_3d(A @ v.squeeze())
     start_time = time()
-    blurshd = jax.pmap(lambda i: jax.lax.map(a_map, imgshd[i]))(jnp.arange(nproc))
+    blurshd = jax.pmap(jax.vmap(a_map))(imgshd)
     time_blur = time() - start_time
     blur = blurshd.reshape((-1, size, size, 1))
     # Normalize blurred images
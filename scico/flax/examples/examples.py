@@ -98,9 +98,10 @@ def load_ct_data(
     npz_test_file = os.path.join(cache_path, "ct_foam2_test.npz")
 
     if os.path.isfile(npz_train_file) and os.path.isfile(npz_test_file):
-        # Load data
-        trdt_in = np.load(npz_train_file)
-        ttdt_in = np.load(npz_test_file)
+        # Load data. Each array is read from the file once, since access
+        # to an entry of the object returned by np.load re-reads it.
+        trdt_in = dict(np.load(npz_train_file))
+        ttdt_in = dict(np.load(npz_test_file))
         # Check image size
         if trdt_in["img"].shape[1] != size:
             runtime_error_scalar("size", "training", size, trdt_in["img"].shape[1])
@@ -233,13 +234,13 @@ def load_foam1_blur_data(
     npz_test_file = os.path.join(cache_path, "dcnv_foam1_test.npz")
 
     if os.path.isfile(npz_train_file) and os.path.isfile(npz_test_file):
-        # Load data and convert arrays to float32.
+        # Load data and convert arrays to float32 (if not already).
         trdt = np.load(npz_train_file)  # Training
         ttdt = np.load(npz_test_file)  # Testing
-        train_in = trdt["image"].astype(np.float32)
-        train_out = trdt["label"].astype(np.float32)
-        test_in = ttdt["image"].astype(np.float32)
-        test_out = ttdt["label"].astype(np.float32)
+        train_in = trdt["image"].astype(np.float32, copy=False)
+        train_out = trdt["label"].astype(np.float32, copy=False)
+        test_in = ttdt["image"].astype(np.float32, copy=False)
+        test_out = ttdt["label"].astype(np.float32, copy=False)
 
         # Check image size
         if train_in.shape[1] != size:
@@ -414,13 +415,13 @@ def load_image_data(
     npz_test_file = os.path.join(cache_path, data_mode + "_bsds_test.npz")
 
     if os.path.isfile(npz_train_file) and os.path.isfile(npz_test_file):
-        # Load data and convert arrays to float32.
+        # Load data and convert arrays to float32 (if not already).
         trdt = np.load(npz_train_file)  # Training
         ttdt = np.load(npz_test_file)  # Testing
-        train_in = trdt["image"].astype(np.float32)
-        train_out = trdt["label"].astype(np.float32)
-        test_in = ttdt["image"].astype(np.float32)
-        test_out = ttdt["label"].astype(np.float32)
+        train_in = trdt["image"].astype(np.float32, copy=False)
+        train_out = trdt["label"].astype(np.float32, copy=False)
+        test_in = ttdt["image"].astype(np.float32, copy=False)
+        test_out = ttdt["label"].astype(np.float32, copy=False)
 
         if check_img_data_requirements(
             train_nimg,
@@ -468,8 +469,8 @@ def load_image_data(
     # after pre-processing for specified data_mode.
     npz_file = os.path.join(bsds_cache_path, "bsds500.npz")
     npz = np.load(npz_file)
-    imgs_train = npz["imgstr"].astype(np.float32)
-    imgs_test = npz["imgstt"].astype(np.float32)
+    imgs_train = npz["imgstr"].astype(np.float32, copy=False)
+    imgs_test = npz["imgstt"].astype(np.float32, copy=False)
 
     # Generate new data.
     if stride is None:
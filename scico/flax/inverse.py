@@ -150,8 +150,12 @@ def cg_solver(A: Callable, b: Array, x0: Array = None, maxiter: int = 50) -> Arr
         return (x, r, p, num), None
 
     if x0 is None:
+        # The residual of the zero initial solution is b, so that
+        # evaluation of A(x0) can be avoided.
         x0 = jnp.zeros_like(b)
-    r0 = b - A(x0)
+        r0 = b
+    else:
+        r0 = b - A(x0)
     num0 = r0.ravel().conj().T @ r0.ravel()
     carry = (x0, r0, r0, num0)
     carry, _ = lax.scan(fun, carry, xs=None, length=maxiter)
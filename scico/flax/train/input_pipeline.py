@@ -17,6 +17,8 @@ warnings.simplefilter(action="ignore", category=FutureWarning)
 
 from typing import Any, Union
 
+import numpy as np
+
 import jax
 import jax.numpy as jnp
 
@@ -66,7 +68,10 @@ class IterateData:
             self.perms = jnp.arange(self.n)
 
         self.perms = self.perms[: self.steps_per_epoch * self.batch_size]  # skips incomplete batch
-        self.perms = self.perms.reshape((self.steps_per_epoch, self.batch_size))
+        # Keep batch indices on the host so that assembling a batch does
+        # not wait on the device, which may still be executing previous
+        # training steps, and prefetching of batches can overlap with them.
+        self.perms = np.asarray(self.perms).reshape((self.steps_per_epoch, self.batch_size))
         self.ns = 0
 
     def __iter__(self):
@@ -18,6 +18,7 @@ from scico.operator._operator import Operator
 from scico.random import randn
 from scico.typing import PRNGKey
 
+from ._circconv import CircularConvolve
 from ._linop import LinearOperator
 
 
@@ -76,6 +77,13 @@ def operator_norm(A: LinearOperator, maxiter: int = 100, key: Optional[PRNGKey]
     :func:`power_iteration`, to estimate
     :math:`\lambda_{\mathrm{max}}(A^H A)`.
 
+    If :math:`A` is a :class:`.CircularConvolve`, :math:`A^H A` is
+    diagonalized by the DFT, and the norm is instead computed directly
+    as the square root of the maximum over frequencies of the sum over
+    filters of :math:`|\hat{\mb{h}}|^2`, where :math:`\hat{\mb{h}}`
+    denotes the DFT of the filter(s), so that `maxiter` and `key` are
+    not used.
+
     Args:
         A: :class:`.LinearOperator` for which operator norm is desired.
         maxiter: Maximum number of power iterations to use. Default: 100
@@ -86,6 +94,13 @@ def operator_norm(A: LinearOperator, maxiter: int = 100, key: Optional[PRNGKey]
         float: Norm of operator :math:`A`.
 
     """
+    if isinstance(A, CircularConvolve):
+        # Axes of h_dft aligned with the output axes; filters along the
+        # leading batch axes are summed in the adjoint, hence in A^H A.
+        # (For a real operator with a user-specified h_dft lacking
+        # conjugate symmetry, this is an upper bound on the norm.)
+        h_dft = A.h_dft.reshape((1,) * (len(A.output_shape) - A.h_dft.ndim) + A.h_dft.shape)
+        return snp.sqrt(snp.max(snp.sum(snp.abs(h_dft) ** 2, axis=A.batch_axes)))
     return snp.sqrt(power_iteration(A.H @ A, maxiter, key)[0].real)
 
 
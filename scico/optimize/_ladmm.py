@@ -13,6 +13,8 @@ from __future__ import annotations
 
 from typing import Optional, Tuple, Union
 
+import jax
+
 import scico.numpy as snp
 from scico.functional import Functional
 from scico.linop import LinearOperator
@@ -89,6 +91,7 @@ class LinearizedADMM(Optimizer):
         mu: float,
         nu: float,
         x0: Optional[Union[Array, BlockArray]] = None,
+        jit: bool = False,
         **kwargs,
     ):
         r"""Initialize a :class:`LinearizedADMM` object.
@@ -101,6 +104,14 @@ class LinearizedADMM(Optimizer):
             nu: Second algorithm parameter.
             x0: Starting point for :math:`\mb{x}`. If ``None``, defaults
                 to an array of zeros.
+            jit: If ``True``, jit-compile the iteration step so that the
+                operator applications, proximal operators, and
+                elementwise updates may be fused by XLA. This requires
+                that the proximal operators of `f` and `g` be
+                traceable by jax, which is not the case, for example,
+                for :class:`.SquaredL2Loss` with a non-diagonal forward
+                operator, since its proximal operator uses
+                :func:`scico.solver.cg`.
             **kwargs: Additional optional parameters handled by
                 initializer of base class :class:`.Optimizer`.
         """
@@ -110,10 +121,39 @@ class LinearizedADMM(Optimizer):
         self.mu: float = mu
         self.nu: float = nu
 
+        def xzu_step(
+            x: Union[Array, BlockArray],
+            z: Union[Array, BlockArray],
+            u: Union[Array, BlockArray],
+            Cx: Union[Array, BlockArray],
+            mu: float,
+            nu: float,
+        ) -> Tuple[
+            Union[Array, BlockArray],
+            Union[Array, BlockArray],
+            Union[Array, BlockArray],
+            Union[Array, BlockArray],
+        ]:
+            proxarg = x - (mu / nu) * self.C.adj(Cx - z + u)
+            x = self.f.prox(proxarg, mu, v0=x)
+            Cx = self.C(x)
+            z_new = self.g.prox(Cx + u, nu, v0=z)
+            u = u + Cx - z_new
+            return x, z_new, u, Cx
+
+        self.xzu_step = jax.jit(xzu_step) if jit else xzu_step
+
+        # pair (x, C x) from initialization or the most recent step, for
+        # re-use in z_init, the following step, and residuals
+        self._Cx_cache: Optional[Tuple[Union[Array, BlockArray], Union[Array, BlockArray]]] = None
         if x0 is None:
             input_shape = C.input_shape
             dtype = C.input_dtype
             x0 = snp.zeros(input_shape, dtype=dtype)
+            # C applied to a zero x0 is zero, so there is no need to evaluate it
+            self._Cx_cache = (x0, snp.zeros(C.output_shape, dtype=C.output_dtype))
+        else:
+            self._Cx_cache = (x0, C(x0))
         self.x = x0
         self.z, self.z_old = self.z_init(self.x)
         self.u = self.u_init(self.x)
@@ -197,7 +237,7 @@ class LinearizedADMM(Optimizer):
         if x is None:
             x = self.x
 
-        return norm(self.C(self.x) - self.z)
+        return norm(self._C_eval(x) - self.z)
 
     def norm_dual_residual(self) -> float:
         r"""Compute the :math:`\ell_2` norm of the dual residual.
@@ -212,6 +252,17 @@ class LinearizedADMM(Optimizer):
         """
         return norm(self.C.adj(self.z - self.z_old))
 
+    def _C_eval(self, x: Union[Array, BlockArray]) -> Union[Array, BlockArray]:
+        r"""Evaluate :math:`C \mb{x}`.
+
+        The value computed in the most recent call to :meth:`step`, or
+        on initialization, is returned if `x` is the corresponding
+        iterate.
+        """
+        if self._Cx_cache is not None and x is self._Cx_cache[0]:
+            return self._Cx_cache[1]
+        return self.C(x)
+
     def z_init(
         self, x0: Union[Array, BlockArray]
     ) -> Tuple[Union[Array, BlockArray], Union[Array, BlockArray]]:
@@ -227,7 +278,7 @@ class LinearizedADMM(Optimizer):
         Args:
             x0: Starting point for :math:`\mb{x}`.
         """
-        z = self.C(x0)
+        z = self._C_eval(x0)
         z_old = z
         return z, z_old
 
@@ -269,11 +320,16 @@ class LinearizedADMM(Optimizer):
         .. math::
             \mb{u}^{(k+1)} =  \mb{u}^{(k)} + C \mb{x}^{(k+1)} -
             \mb{z}^{(k+1)} \;.
-        """
-        proxarg = self.x - (self.mu / self.nu) * self.C.conj().T(self.C(self.x) - self.z + self.u)
-        self.x = self.f.prox(proxarg, self.mu, v0=self.x)
 
+        The three updates are evaluated by a single function, which is
+        jit-compiled if the `jit` initializer parameter is ``True``. Since
+        :math:`C \mb{x}^{(k+1)}` is computed in the final two updates,
+        it is retained for use in the first update of the following
+        iteration, so that :math:`C` and its adjoint are each applied
+        only once per iteration.
+        """
+        Cx = self._C_eval(self.x)
+        # jax arrays are immutable, so z_old need only reference the current z
         self.z_old = self.z
-        Cx = self.C(self.x)
-        self.z = self.g.prox(Cx + self.u, self.nu, v0=self.z)
-        self.u = self.u + Cx - self.z
+        self.x, self.z, self.u, Cx = self.xzu_step(self.x, self.z, self.u, Cx, self.mu, self.nu)
+        self._Cx_cache = (self.x, Cx)
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 import tempfile
 from functools import partial
 
@@ -283,6 +285,39 @@ def test_FlaxMap_batch_call(testobj):
     assert x.ndim == out.ndim
 
 
+# Run in a separate process since the number of host devices can only
+# be set before jax is initialized.
+_flaxmap_pmap_script = """
+import numpy as np
+import jax
+from scico import flax as sflax
+from scico.random import randn
+
+assert jax.local_device_count() == 4
+x, key = randn((8, 32, 32, 1), seed=1234)
+dncnn = sflax.DnCNNNet(depth=3, channels=1, num_filters=16)
+variables = dncnn.init(key, x)
+fmap = sflax.FlaxMap(dncnn, variables, pmap=True)
+# Batch sizes that are, and are not, a multiple of the device count
+for batch in (8, 6):
+    out = fmap(x[:batch])
+    ref = dncnn.apply(variables, x[:batch], train=False, mutable=False)
+    assert out.shape == ref.shape
+    np.testing.assert_allclose(out, ref, rtol=1e-5, atol=1e-6)
+"""
+
+
+def test_FlaxMap_pmap():
+    # Test that batched evaluation split across devices matches direct
+    # application of the model.
+    env = dict(
+        os.environ,
+        JAX_PLATFORMS="cpu",
+        XLA_FLAGS="--xla_force_host_platform_device_count=4",
+    )
+    subprocess.run([sys.executable, "-c", _flaxmap_pmap_script], env=env, check=True)
+
+
 def test_FlaxMap_blockarray_exception(testobj):
 
     from scico.numpy import BlockArray
@@ -153,6 +153,18 @@ class TestSet:
             np.testing.assert_array_less(1e-2 * np.ones(alphaval.shape), alphaval)
 
 
+@pytest.mark.parametrize("x0", [None, 1.0])
+def test_cg_solver(x0):
+    N = 16
+    M, key = random.randn((N, N), seed=4321)
+    M = M.T @ M + N * jnp.eye(N, dtype=M.dtype)
+    b, key = random.randn((N,), key=key)
+    if x0 is not None:
+        x0 = x0 * jnp.ones((N,), dtype=M.dtype)
+    x = sflax.inverse.cg_solver(lambda v: M @ v, b, x0=x0, maxiter=N)
+    np.testing.assert_allclose(x, np.linalg.solve(M, b), rtol=1e-4, atol=1e-5)
+
+
 @pytest.mark.skipif(not have_astra, reason="astra package not installed")
 class TestCT:
     def setup_method(self, method):
@@ -79,6 +79,25 @@ def test_operator_norm():
     assert np.abs(Znorm) < 1e-6
 
 
+@pytest.mark.parametrize("h_shape", [(3, 3), (2, 3, 3)])
+@pytest.mark.parametrize("input_shape", [(16, 16), (2, 16, 16)])
+def test_operator_norm_circconv(h_shape, input_shape):
+    h, key = randn(h_shape, dtype=np.float32, seed=0)
+    C = linop.CircularConvolve(h=h, input_shape=input_shape, ndims=2)
+    # generic LinearOperator, so that power iteration is used
+    G = linop.LinearOperator(
+        input_shape=C.input_shape,
+        output_shape=C.output_shape,
+        eval_fn=C,
+        adj_fn=C.adj,
+        input_dtype=C.input_dtype,
+        output_dtype=C.output_dtype,
+    )
+    Cnorm = linop.operator_norm(C)
+    Gnorm = linop.operator_norm(G, maxiter=500, key=key)
+    assert np.abs(Cnorm - Gnorm) / Gnorm < 1e-3
+
+
 @pytest.mark.parametrize("dtype", [snp.float32, snp.complex64])
 @pytest.mark.parametrize("inc_eval", [True, False])
 def test_jacobian(dtype, inc_eval):
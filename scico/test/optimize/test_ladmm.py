@@ -8,6 +8,30 @@ from scico.numpy import BlockArray
 from scico.optimize import LinearizedADMM
 
 
+def counting_matrix_operator(M):
+    # Linear operator that records the number of applications of M and
+    # of its adjoint
+    count = {"eval": 0, "adj": 0}
+
+    def eval_fn(x):
+        count["eval"] += 1
+        return M @ x
+
+    def adj_fn(y):
+        count["adj"] += 1
+        return M.conj().T @ y
+
+    C = linop.LinearOperator(
+        input_shape=(M.shape[1],),
+        output_shape=(M.shape[0],),
+        eval_fn=eval_fn,
+        adj_fn=adj_fn,
+        input_dtype=M.dtype,
+        output_dtype=M.dtype,
+    )
+    return C, count
+
+
 class TestMisc:
     def setup_method(self, method):
         np.random.seed(12345)
@@ -146,6 +170,115 @@ class TestReal:
         x = ladmm_.solve()
         assert (snp.linalg.norm(self.grdA(x) - self.grdb) / snp.linalg.norm(self.grdb)) < 1e-4
 
+    def test_residual(self):
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C = linop.MatrixOperator(self.Bmx)
+        ladmm_ = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5)
+        ladmm_.solve()
+        np.testing.assert_allclose(
+            ladmm_.norm_primal_residual(), snp.linalg.norm(C(ladmm_.x) - ladmm_.z), rtol=1e-5
+        )
+        x = ladmm_.x + 1.0
+        np.testing.assert_allclose(
+            ladmm_.norm_primal_residual(x), snp.linalg.norm(C(x) - ladmm_.z), rtol=1e-5
+        )
+
+    def test_nondiagonal_loss(self):
+        # Prox of SquaredL2Loss with non-diagonal A is not traceable
+        A = linop.MatrixOperator(self.Amx + 0.1 * self.Bmx[0:8])
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.L1Norm()
+        C = linop.MatrixOperator(self.Bmx)
+        ladmm_ = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5)
+        x = ladmm_.solve()
+        assert snp.all(snp.isfinite(x))
+
+    def test_jit(self):
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C = linop.MatrixOperator(self.Bmx)
+        x = []
+        for jit in (False, True):
+            ladmm_ = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5, jit=jit)
+            x.append(ladmm_.solve())
+        np.testing.assert_allclose(x[0], x[1], rtol=1e-5)
+
+    def test_x0_none(self):
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C = linop.MatrixOperator(self.Bmx)
+        ladmm0 = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5)
+        ladmm1 = LinearizedADMM(
+            f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5, x0=snp.zeros(C.input_shape)
+        )
+        np.testing.assert_allclose(ladmm0.z, ladmm1.z)
+        np.testing.assert_allclose(ladmm0.u, ladmm1.u)
+        np.testing.assert_allclose(ladmm0.solve(), ladmm1.solve(), rtol=1e-6)
+
+    @pytest.mark.parametrize("x0_none", [True, False])
+    def test_z_init_override(self, x0_none):
+        class OffsetLinearizedADMM(LinearizedADMM):
+            def z_init(self, x0):
+                z = self.C(x0) + 1.0
+                return z, z
+
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C = linop.MatrixOperator(self.Bmx)
+        x0 = None if x0_none else snp.zeros(C.input_shape)
+        ladmm_ = OffsetLinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5, x0=x0)
+        np.testing.assert_allclose(ladmm_.z, snp.ones(C.output_shape))
+
+    @pytest.mark.parametrize("x0_none", [True, False])
+    def test_operator_count(self, x0_none):
+        # C and its adjoint should each be applied once per iteration
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C, count = counting_matrix_operator(self.Bmx)
+        x0 = None if x0_none else A.adj(self.y)
+        ladmm_ = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5, x0=x0)
+        ninit = 0 if x0_none else 1
+        assert count == {"eval": ninit, "adj": 0}
+        for _ in range(3):
+            ladmm_.step()
+        assert count == {"eval": ninit + 3, "adj": 3}
+
+    def test_u_retained(self):
+        # Previous values of working variables must remain valid after a step
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C = linop.MatrixOperator(self.Bmx)
+        ladmm_ = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5)
+        ladmm_.step()
+        u_prev = ladmm_.u
+        ladmm_.step()
+        assert snp.all(snp.isfinite(ladmm_.u - u_prev))
+
+    def test_residual_reuse(self):
+        # The primal residual should re-use C x from the most recent step
+        A = linop.Diagonal(snp.diag(self.Amx))
+        f = loss.SquaredL2Loss(y=self.y, A=A)
+        g = (self.λ / 2) * functional.SquaredL2Norm()
+        C, count = counting_matrix_operator(self.Bmx)
+        ladmm_ = LinearizedADMM(f=f, g=g, C=C, mu=1e-2, nu=2e-1, maxiter=5)
+        ladmm_.step()
+        neval = count["eval"]
+        r = ladmm_.norm_primal_residual()
+        assert count["eval"] == neval
+        np.testing.assert_allclose(r, snp.linalg.norm(self.Bmx @ ladmm_.x - ladmm_.z), rtol=1e-5)
+        # C x must be recomputed if the caller rebinds x
+        ladmm_.x = ladmm_.x + 1.0
+        r = ladmm_.norm_primal_residual()
+        assert count["eval"] == neval + 1
+        np.testing.assert_allclose(r, snp.linalg.norm(self.Bmx @ ladmm_.x - ladmm_.z), rtol=1e-5)
+
 
 class TestComplex:
     def setup_method(self, method):
@@ -2,6 +2,7 @@ from collections import OrderedDict
 
 import pytest
 
+import scico.numpy as snp
 from scico import diagnostics
 
 
@@ -15,6 +16,12 @@ class TestSet:
         assert its.history()[1].Obj_Val == 1e2
         assert its.history(transpose=True).Obj_Val == [1.5, 100.0]
 
+    def test_itstat_array(self):
+        its = diagnostics.IterationStats(OrderedDict({"Iter": "%d", "Obj Val": "%8.2e"}))
+        val = snp.array(1.5)
+        its.insert((0, val))
+        assert its.history()[0].Obj_Val is val
+
     def test_display(self, capsys):
         its = diagnostics.IterationStats({"Iter": "%d"}, display=True, period=2, overwrite=False)
         its.insert((0,))